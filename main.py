@@ -1,11 +1,52 @@
 import argparse
 import os
+import re
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from transcription_core import transcribe_audio_core, SUPPORTED_FORMATS
 
+# Gradio module, imported by launch_gradio_interface so CLI start-up stays fast
+gr = None
+
+# Choices offered for the Whisper model, task and device settings
+WHISPER_MODEL_CHOICES = ("tiny.en", "base.en", "small.en", "medium.en", "tiny", "base", "small", "medium", "large", "turbo")
+TASK_CHOICES = ("transcribe", "translate")
+DEVICE_CHOICES = ("auto", "cuda", "cpu")
+
+# Audio file extensions accepted in the inputs folder
+AUDIO_EXTS = ('.mp3', '.wav', '.m4a', '.flac', '.ogg', '.wma', '.aac')
+_AUDIO_EXT_SET = frozenset(AUDIO_EXTS)
+
+# Dropdown choice shown when the inputs folder has no audio; its value is empty
+NO_AUDIO_FILES_CHOICE = ("No audio files found - upload or record something first", "")
+
+# Directory listing caches, keyed on the directory's modification time
+_AUDIO_LIST_CACHE = {"mtime": None, "value": None}
+_ACTIVITY_CACHE = {"mtime": None, "value": None}
+
+# Set once the inputs/outputs folders are known to exist
+_DIRS_READY = False
+
+# Output job folders are named with a YYYYMMDD_HHMMSS timestamp
+_JOB_FOLDER_RE = re.compile(r"[0-9]{8}_[0-9]{6}")
+
+# Output formats shown in the preview tabs, in tab order
+PREVIEW_FORMATS = ("txt", "srt", "vtt", "tsv", "json")
+# Large outputs are only partially shown; Gradio textboxes stall on huge strings
+PREVIEW_MAX_BYTES = 64 * 1024
+
+def ensure_io_dirs():
+    """Create the inputs and outputs folders once per process."""
+    global _DIRS_READY
+    if not _DIRS_READY:
+        os.makedirs("inputs", exist_ok=True)
+        os.makedirs("outputs", exist_ok=True)
+        _DIRS_READY = True
+
+@lru_cache(maxsize=None)
 def get_language_mapping():
-    """Load language mapping from environment variables."""
+    """Load language mapping from environment variables (parsed once per process)."""
     # Get languages from environment variable
     languages_str = os.getenv("WHISPER_LANGUAGES", "")
     
@@ -13,11 +54,11 @@ def get_language_mapping():
         raise ValueError("WHISPER_LANGUAGES not found in .env file. Please check your .env configuration.")
     
     # Parse the string into a dictionary
-    language_mapping = {}
-    for pair in languages_str.split(','):
-        if ':' in pair:
-            display_name, code = pair.split(':', 1)
-            language_mapping[display_name.strip()] = code.strip()
+    language_mapping = {
+        display_name.strip(): code.strip()
+        for pair in languages_str.split(',') if ':' in pair
+        for display_name, code in [pair.split(':', 1)]
+    }
     
     if not language_mapping:
         raise ValueError("No valid language mappings found in WHISPER_LANGUAGES. Please check your .env configuration.")
@@ -29,48 +70,63 @@ def get_language_code(display_name):
     language_mapping = get_language_mapping()
     return language_mapping.get(display_name, "auto")
 
+@lru_cache(maxsize=None)
+def get_code_to_display():
+    """Map Whisper language codes back to their display names."""
+    # Reversed so the first display name listed for a code wins
+    return {code: display_name for display_name, code in reversed(get_language_mapping().items())}
+
 def save_audio_to_inputs(audio_file):
     """Save uploaded audio file to inputs folder."""
     if audio_file is None:
         return "❌ No audio file provided."
     try:
-        import shutil
-        import tempfile
-        from pathlib import Path
-        import os
-        # Ensure inputs directory exists
+        # Ensure inputs directory exists; it is user-managed and may be deleted while the UI runs
         os.makedirs("inputs", exist_ok=True)
         # If audio_file is a tuple (filepath, sample_rate), handle Gradio's new format
         if isinstance(audio_file, tuple) and len(audio_file) == 2 and isinstance(audio_file[0], str):
             audio_file = audio_file[0]
-        source_path = Path(audio_file)
-        filename = source_path.name
+        filename = os.path.basename(audio_file)
+        # Files already in the inputs folder don't need another copy
+        if os.path.dirname(os.path.abspath(audio_file)) == os.path.abspath("inputs"):
+            return f"✅ Saved audio as: {filename}"
         
         # Simple rename: if filename starts with "audio", change to "record"
         if filename.lower().startswith("audio"):
-            extension = Path(filename).suffix or ".wav"
+            extension = os.path.splitext(filename)[1] or ".wav"
             filename = f"audio-record{extension}"
         # If the filename doesn't have an extension, add .wav
-        if not filename.lower().endswith(('.mp3', '.wav', '.m4a', '.flac', '.ogg', '.wma', '.aac')):
+        if os.path.splitext(filename)[1].lower() not in _AUDIO_EXT_SET:
             filename += '.wav'
-        destination_path = os.path.join("inputs", filename)
-        # Handle duplicate filenames
+        # Handle duplicate filenames against a single snapshot of the folder
+        with os.scandir("inputs") as entries:
+            existing_names = {entry.name for entry in entries}
         counter = 1
-        base_name = Path(filename).stem
-        extension = Path(filename).suffix
-        while os.path.exists(destination_path):
+        base_name, extension = os.path.splitext(filename)
+        new_filename = filename
+        while True:
+            if new_filename not in existing_names:
+                destination_path = os.path.join("inputs", new_filename)
+                try:
+                    # Reserve the name so a concurrent upload can't claim it too
+                    os.close(os.open(destination_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                    break
+                except FileExistsError:
+                    pass
             new_filename = f"{base_name}_{counter}{extension}"
-            destination_path = os.path.join("inputs", new_filename)
             counter += 1
-        shutil.copy2(str(source_path), destination_path)
-        return f"✅ Saved audio as: {Path(destination_path).name}"
+        try:
+            shutil.copyfile(audio_file, destination_path)
+        except Exception:
+            os.remove(destination_path)
+            raise
+        _AUDIO_LIST_CACHE["mtime"] = None
+        return f"✅ Saved audio as: {new_filename}"
     except Exception as e:
         return f"❌ Error saving audio: {str(e)}"
 
 def save_audio_and_update_dropdown(audio_file):
     """Save uploaded audio file and return updated dropdown with new file selected."""
-    import gradio as gr
-    
     # Save the audio file
     status = save_audio_to_inputs(audio_file)
     # Get updated choices
@@ -79,70 +135,68 @@ def save_audio_and_update_dropdown(audio_file):
     selected_filename = None
     if status.startswith("✅ Saved audio as:"):
         saved_filename = status.split(": ")[1]
-        # Find the corresponding choice that contains this filename
-        for choice in updated_choices:
-            if choice.startswith(saved_filename):
-                selected_filename = choice
-                break
+        # Select the saved file if it is listed
+        if any(value == saved_filename for _, value in updated_choices):
+            selected_filename = saved_filename
     # If not found, just select the first available file
-    if not selected_filename and updated_choices and updated_choices[0] != "No audio files found - upload or record something first":
-        selected_filename = updated_choices[0]
+    if not selected_filename and updated_choices[0] != NO_AUDIO_FILES_CHOICE:
+        selected_filename = updated_choices[0][1]
     return status, gr.Dropdown(choices=updated_choices, value=selected_filename)
 
 def get_audio_files_list():
-    """Get list of audio files from inputs folder with file info."""
-    if not os.path.exists("inputs"):
-        os.makedirs("inputs")
+    """Get (label with size, filename) dropdown choices for the audio files in the inputs folder."""
+    # Reuse the previous listing while the directory is unchanged
+    try:
+        mtime = os.stat("inputs").st_mtime_ns
+    except FileNotFoundError:
+        return [NO_AUDIO_FILES_CHOICE]
+    if _AUDIO_LIST_CACHE["mtime"] == mtime:
+        return _AUDIO_LIST_CACHE["value"]
     
     files = []
-    for file in os.listdir("inputs"):
-        if file.lower().endswith(('.mp3', '.wav', '.m4a', '.flac', '.ogg', '.wma', '.aac')):
-            file_path = os.path.join("inputs", file)
-            size = os.path.getsize(file_path)
-            size_mb = size / (1024 * 1024)
-            files.append(f"{file} ({size_mb:.1f} MB)")
+    with os.scandir("inputs") as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(AUDIO_EXTS) and entry.is_file(follow_symlinks=False):
+                size_mb = entry.stat().st_size / (1024 * 1024)
+                files.append((f"{entry.name} ({size_mb:.1f} MB)", entry.name))
     
     if not files:
-        return ["No audio files found - upload or record something first"]
+        files = [NO_AUDIO_FILES_CHOICE]
+    _AUDIO_LIST_CACHE["mtime"] = mtime
+    _AUDIO_LIST_CACHE["value"] = files
     return files
 
 def display_audio_files():
     """Return a formatted string showing all available audio files."""
     files = get_audio_files_list()
-    if files == ["No audio files found - upload or record something first"]:
+    if files == [NO_AUDIO_FILES_CHOICE]:
         return "No audio files found in the inputs folder.\nUpload or record some audio to get started!"
     
     file_list_text = "Available audio files:\n"
-    for i, file in enumerate(files, 1):
-        file_list_text += f"{i}. {file}\n"
+    for i, (label, _) in enumerate(files, 1):
+        file_list_text += f"{i}. {label}\n"
     file_list_text += f"\nTotal files: {len(files)}"
     return file_list_text
 
 def delete_audio_file(filename):
     """Delete selected audio file from inputs folder."""
-    if not filename or filename.startswith("No audio files found"):
+    if not filename:
         return "❌ No file selected for deletion."
     
-    # Extract just the filename (remove size info)
-    if '(' in filename and ')' in filename:
-        actual_filename = filename.split(' (')[0]
-    else:
-        actual_filename = filename.strip()
-    
-    file_path = os.path.join("inputs", actual_filename)
+    file_path = os.path.join("inputs", filename)
     
     try:
         if os.path.exists(file_path):
             os.remove(file_path)
-            return f"✅ Deleted: {actual_filename}"
+            _AUDIO_LIST_CACHE["mtime"] = None
+            return f"✅ Deleted: {filename}"
         else:
-            return f"❌ File not found: {actual_filename}"
+            return f"❌ File not found: {filename}"
     except Exception as e:
         return f"❌ Error deleting file: {str(e)}"
 
 def delete_audio_file_and_refresh(filename):
     """Delete selected audio file and return updated dropdown, status, and clear audio input."""
-    import gradio as gr
     status = delete_audio_file(filename)
     updated_choices = get_audio_files_list()
     
@@ -153,16 +207,10 @@ def delete_audio_file_and_refresh(filename):
 
 def load_selected_file_to_audio_input(filename):
     """Load selected file from dropdown into audio input component."""
-    if not filename or filename.startswith("No audio files found"):
+    if not filename:
         return None
     
-    # Extract just the filename (remove size info)
-    if '(' in filename and ')' in filename:
-        actual_filename = filename.split(' (')[0]
-    else:
-        actual_filename = filename.strip()
-    
-    file_path = os.path.join("inputs", actual_filename)
+    file_path = os.path.join("inputs", filename)
     
     if os.path.exists(file_path):
         return file_path
@@ -171,45 +219,83 @@ def load_selected_file_to_audio_input(filename):
 
 def get_activity_logs():
     """Get list of all previous transcription jobs from outputs folder."""
-    if not os.path.exists("outputs"):
+    # Reuse the previous listing while no job folders were added or removed
+    try:
+        mtime = os.stat("outputs").st_mtime_ns
+    except FileNotFoundError:
         return []
+    if _ACTIVITY_CACHE["mtime"] == mtime:
+        return _ACTIVITY_CACHE["value"]
     
     activities = []
-    for folder in sorted(os.listdir("outputs"), reverse=True):  # Most recent first
-        folder_path = os.path.join("outputs", folder)
-        if os.path.isdir(folder_path):
-            # Parse timestamp from folder name (YYYYMMDD_HHMMSS)
-            try:
-                from datetime import datetime
-                timestamp = datetime.strptime(folder, "%Y%m%d_%H%M%S")
-                formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                
-                # Get files in this output folder
-                files = []
-                audio_file = ""
-                for file in os.listdir(folder_path):
-                    if not file.endswith('.zip'):
-                        files.append(file)
-                        # Try to determine the original audio file name
-                        if not audio_file:
-                            base_name = os.path.splitext(file)[0]
-                            audio_file = base_name
-                
-                if files:  # Only include folders with files
-                    activity_info = f"{formatted_time} | {audio_file} | {len(files)} files | {folder}"
-                    activities.append(activity_info)
-            except ValueError:
-                # Skip folders that don't match the timestamp format
-                continue
+    with os.scandir("outputs") as entries:
+        folders = sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name, reverse=True)  # Most recent first
+    for folder in folders:
+        # Skip folders that don't match the timestamp format
+        name = folder.name
+        if not _JOB_FOLDER_RE.fullmatch(name):
+            continue
+        formatted_time = f"{name[0:4]}-{name[4:6]}-{name[6:8]} {name[9:11]}:{name[11:13]}:{name[13:15]}"
+        
+        # Get files in this output folder
+        files = []
+        audio_file = ""
+        with os.scandir(folder.path) as folder_entries:
+            for entry in folder_entries:
+                if not entry.name.endswith('.zip'):
+                    files.append(entry.name)
+                    # Try to determine the original audio file name
+                    if not audio_file:
+                        base_name = os.path.splitext(entry.name)[0]
+                        audio_file = base_name
+        
+        if files:  # Only include folders with files
+            activity_info = f"{formatted_time} | {audio_file} | {len(files)} files | {name}"
+            activities.append(activity_info)
     
     if not activities:
-        return ["No previous transcription jobs found"]
+        activities = ["No previous transcription jobs found"]
+    _ACTIVITY_CACHE["mtime"] = mtime
+    _ACTIVITY_CACHE["value"] = activities
     return activities
 
+def find_output_files(folder_path):
+    """Map each previewable format to its output file path in a job folder."""
+    output_files = {}
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            fmt = os.path.splitext(entry.name)[1][1:]
+            if fmt in PREVIEW_FORMATS and entry.is_file(follow_symlinks=False):
+                output_files[fmt] = entry.path
+    return output_files
+
+def read_output_preview(file_path):
+    """Read the beginning of an output file for display in a preview tab."""
+    if not file_path:
+        return ""
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            data = f.read(PREVIEW_MAX_BYTES)
+        if size <= PREVIEW_MAX_BYTES:
+            return data.decode('utf-8')
+        # The cut may split a multi-byte character, so drop any partial one
+        return data.decode('utf-8', errors='ignore') + f"\n… (truncated, {size - PREVIEW_MAX_BYTES} more bytes)"
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return ""
+
+def load_active_preview(output_files, active_format):
+    """Fill only the currently visible preview tab; other tabs load when selected."""
+    return tuple(
+        read_output_preview(output_files.get(fmt)) if fmt == active_format else ""
+        for fmt in PREVIEW_FORMATS
+    )
+
 def load_activity_job(selected_activity):
-    """Load selected transcription job into preview components."""
+    """Find the output files of the selected transcription job."""
     if not selected_activity or selected_activity.startswith("No previous"):
-        return "", "", "", "", "", "No job selected"
+        return {}, "No job selected"
     
     # Extract folder name from activity info (last part after |)
     try:
@@ -217,49 +303,23 @@ def load_activity_job(selected_activity):
         folder_path = os.path.join("outputs", folder_name)
         
         if not os.path.exists(folder_path):
-            return "", "", "", "", "", f"❌ Job folder not found: {folder_name}"
-        
-        # Read all output files
-        txt_content = ""
-        srt_content = ""
-        vtt_content = ""
-        tsv_content = ""
-        json_content = ""
+            return {}, f"❌ Job folder not found: {folder_name}"
         
-        for file in os.listdir(folder_path):
-            if file.endswith('.zip'):
-                continue
-                
-            file_path = os.path.join(folder_path, file)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if file.endswith('.txt'):
-                        txt_content = content
-                    elif file.endswith('.srt'):
-                        srt_content = content
-                    elif file.endswith('.vtt'):
-                        vtt_content = content
-                    elif file.endswith('.tsv'):
-                        tsv_content = content
-                    elif file.endswith('.json'):
-                        json_content = content
-            except Exception as e:
-                print(f"Error reading {file}: {e}")
-        
-        return txt_content, srt_content, vtt_content, tsv_content, json_content, f"✅ Loaded job: {folder_name}"
+        return find_output_files(folder_path), f"✅ Loaded job: {folder_name}"
     
     except Exception as e:
-        return "", "", "", "", "", f"❌ Error loading job: {str(e)}"
+        return {}, f"❌ Error loading job: {str(e)}"
 
 def launch_gradio_interface():
     """Launch the Gradio web interface."""
+    global gr
     try:
         import gradio as gr
-        from pathlib import Path
     except ImportError:
         print("❌ Error: Gradio is not installed. Please run: uv add gradio")
         return 1
+    
+    ensure_io_dirs()
 
     def gradio_transcribe(audio_file, selected_file, model, language, task, formats, device):
         """Gradio interface function for audio transcription."""
@@ -267,19 +327,11 @@ def launch_gradio_interface():
             # Determine which audio source to use
             audio_path = None
             
-            if selected_file and selected_file.strip() and not selected_file.startswith("No audio files found"):
+            if selected_file:
                 # Use selected file from inputs folder
-                # Check if it's just a filename or has size info
-                if '(' in selected_file and ')' in selected_file:
-                    # Extract filename from "filename (size)" format
-                    actual_filename = selected_file.split(' (')[0]
-                else:
-                    # It's just the filename
-                    actual_filename = selected_file.strip()
-                
-                audio_path = os.path.join("inputs", actual_filename)
+                audio_path = os.path.join("inputs", selected_file)
                 if not os.path.exists(audio_path):
-                    return f"❌ Selected file not found: {actual_filename}", "", "", "", "", ""
+                    return f"❌ Selected file not found: {selected_file}", {}
             elif audio_file is not None:
                 # Save uploaded/recorded audio and use it
                 saved_result = save_audio_to_inputs(audio_file)
@@ -288,60 +340,33 @@ def launch_gradio_interface():
                     filename = saved_result.split(": ")[1]
                     audio_path = os.path.join("inputs", filename)
                 else:
-                    return saved_result, "", "", "", "", ""
+                    return saved_result, {}
             else:
-                return "❌ Please upload an audio file, record audio, or select an existing file.", "", "", "", "", ""
+                return "❌ Please upload an audio file, record audio, or select an existing file.", {}
             
             if not formats:
-                return "❌ Please select at least one output format.", "", "", "", "", ""
+                return "❌ Please select at least one output format.", {}
             
             # Convert display language name to language code
             language_code = get_language_code(language)
             
             # Use the transcription core
             result = transcribe_audio_core(audio_path, model, language_code, task, formats, device)
+            # The new job's files are written after its folder, so refresh the job list
+            _ACTIVITY_CACHE["mtime"] = None
             
             # transcribe_audio_core returns a dict with output_dir, files, etc.
             # No need to check for "success" key since function raises exceptions on error
             output_path = result["output_dir"]
             
-            # Read preview files
-            txt_content = ""
-            srt_content = ""
-            vtt_content = ""
-            tsv_content = ""
-            json_content = ""
-            
-            # Look for output files
-            for file in os.listdir(output_path):
-                file_path = os.path.join(output_path, file)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if file.endswith('.txt'):
-                            txt_content = content
-                        elif file.endswith('.srt'):
-                            srt_content = content
-                        elif file.endswith('.vtt'):
-                            vtt_content = content
-                        elif file.endswith('.tsv'):
-                            tsv_content = content
-                        elif file.endswith('.json'):
-                            json_content = content
-                except Exception as e:
-                    print(f"Error reading {file}: {e}")
-            
+            # Preview tabs read their file lazily from this mapping
             return (
                 f"✅ Transcription completed! Output saved to: {output_path}",
-                txt_content,
-                srt_content,
-                vtt_content,
-                tsv_content,
-                json_content
+                find_output_files(output_path)
             )
                 
         except Exception as e:
-            return f"❌ Error during transcription: {str(e)}", "", "", "", "", ""
+            return f"❌ Error during transcription: {str(e)}", {}
 
     # Create the Gradio interface
     with gr.Blocks(title="🎤 Whisper Voice Transcription") as interface:
@@ -409,7 +434,7 @@ def launch_gradio_interface():
                 gr.Markdown("### 👂 Whisper Model Setup")
                 
                 model_input = gr.Dropdown(
-                    choices=["tiny.en", "base.en", "small.en", "medium.en", "tiny", "base", "small", "medium" "large", "turbo"],
+                    choices=WHISPER_MODEL_CHOICES,
                     value=os.getenv("WHISPER_MODEL", "small.en"),
                     label="🏋️‍♂️ Model Sizes"
                 )
@@ -417,21 +442,14 @@ def launch_gradio_interface():
                 # Determine default language for dropdown
                 language_mapping = get_language_mapping()
                 env_language_code = os.getenv("WHISPER_LANGUAGE", "auto")
-                # Find display name for env_language_code
-                default_language_display = None
-                for display, code in language_mapping.items():
-                    if code == env_language_code:
-                        default_language_display = display
-                        break
-                if not default_language_display:
-                    default_language_display = "Auto Detect"
+                default_language_display = get_code_to_display().get(env_language_code, "Auto Detect")
                 language_input = gr.Dropdown(
                     choices=list(language_mapping.keys()),
                     value=default_language_display,
                     label="🌍 Language"
                 )
                 task_input = gr.Radio(
-                    choices=["transcribe", "translate"],
+                    choices=TASK_CHOICES,
                     value=os.getenv("WHISPER_TASK", "transcribe"),
                     label="📝 Task",
                     info="Transcribe: Convert speech to text in original language | Translate: Convert speech to English text (from any language)"
@@ -444,7 +462,7 @@ def launch_gradio_interface():
                 )
                 
                 device_input = gr.Radio(
-                    choices=["auto", "cuda", "cpu"],
+                    choices=DEVICE_CHOICES,
                     value=os.getenv("WHISPER_DEVICE", "auto"),
                     label="⚙️ Processing Device"
                 )
@@ -460,8 +478,12 @@ def launch_gradio_interface():
 
                 gr.Markdown("---")
                 
+                # Output file paths of the shown job and the visible preview tab
+                output_files_state = gr.State({})
+                active_format_state = gr.State("txt")
+                
                 with gr.Tabs():
-                    with gr.Tab("📄 TXT"):
+                    with gr.Tab("📄 TXT") as txt_tab:
                         txt_preview = gr.Textbox(
                             label="Plain Text Output",
                             lines=10,
@@ -470,7 +492,7 @@ def launch_gradio_interface():
                             placeholder="Transcribed text will appear here..."
                         )
                     
-                    with gr.Tab("🎬 SRT"):
+                    with gr.Tab("🎬 SRT") as srt_tab:
                         srt_preview = gr.Textbox(
                             label="SRT Subtitle Output",
                             lines=10,
@@ -479,7 +501,7 @@ def launch_gradio_interface():
                             placeholder="SRT subtitle format will appear here..."
                         )
                     
-                    with gr.Tab("🌐 VTT"):
+                    with gr.Tab("🌐 VTT") as vtt_tab:
                         vtt_preview = gr.Textbox(
                             label="VTT Subtitle Output",
                             lines=10,
@@ -488,7 +510,7 @@ def launch_gradio_interface():
                             placeholder="WebVTT format will appear here..."
                         )
                     
-                    with gr.Tab("📊 TSV"):
+                    with gr.Tab("📊 TSV") as tsv_tab:
                         tsv_preview = gr.Textbox(
                             label="TSV Data Output",
                             lines=10,
@@ -497,7 +519,7 @@ def launch_gradio_interface():
                             placeholder="Tab-separated values will appear here..."
                         )
                     
-                    with gr.Tab("🔧 JSON"):
+                    with gr.Tab("🔧 JSON") as json_tab:
                         json_preview = gr.Textbox(
                             label="JSON Output",
                             lines=10,
@@ -505,12 +527,27 @@ def launch_gradio_interface():
                             interactive=False,
                             placeholder="JSON format will appear here..."
                         )
+                
+                download_files = gr.File(
+                    label="📥 Full Output Files",
+                    file_count="multiple",
+                    interactive=False
+                )
         
         # Connect the transcribe button to the function
+        preview_outputs = [txt_preview, srt_preview, vtt_preview, tsv_preview, json_preview]
         transcribe_btn.click(
             fn=gradio_transcribe,
             inputs=[audio_input, selected_file_input, model_input, language_input, task_input, formats_input, device_input],
-            outputs=[status_output, txt_preview, srt_preview, vtt_preview, tsv_preview, json_preview]
+            outputs=[status_output, output_files_state]
+        ).then(
+            fn=load_active_preview,
+            inputs=[output_files_state, active_format_state],
+            outputs=preview_outputs
+        ).then(
+            fn=lambda output_files: list(output_files.values()) or None,
+            inputs=output_files_state,
+            outputs=download_files
         ).then(
             # Refresh activity logs after transcription
             fn=lambda: gr.Dropdown(choices=get_activity_logs()),
@@ -559,9 +596,26 @@ def launch_gradio_interface():
         activity_list.change(
             fn=load_activity_job,
             inputs=activity_list,
-            outputs=[txt_preview, srt_preview, vtt_preview, tsv_preview, json_preview, activity_status]
+            outputs=[output_files_state, activity_status]
+        ).then(
+            fn=load_active_preview,
+            inputs=[output_files_state, active_format_state],
+            outputs=preview_outputs
+        ).then(
+            fn=lambda output_files: list(output_files.values()) or None,
+            inputs=output_files_state,
+            outputs=download_files
         )
         
+        # Read a preview file only when its tab is opened
+        preview_tabs = [txt_tab, srt_tab, vtt_tab, tsv_tab, json_tab]
+        for fmt, tab, preview in zip(PREVIEW_FORMATS, preview_tabs, preview_outputs):
+            tab.select(
+                fn=lambda output_files, fmt=fmt: (fmt, read_output_preview(output_files.get(fmt))),
+                inputs=output_files_state,
+                outputs=[active_format_state, preview]
+            )
+        
         # Footer
         gr.Markdown("""
         ---
@@ -608,6 +662,7 @@ def run_cli_mode(args):
     # Use the transcription core
     try:
         result = transcribe_audio_core(args.audio, args.model, args.language, args.task, args.formats, args.device)
+        _ACTIVITY_CACHE["mtime"] = None
         print(f"✅ Transcription completed successfully!")
         print(f"📁 Output directory: {result['output_dir']}")
         return 0
@@ -626,7 +681,7 @@ def main():
     parser.add_argument("--audio", default=os.getenv("WHISPER_AUDIO", ""), help="Path to audio file")
     parser.add_argument("--model", default=os.getenv("WHISPER_MODEL", "small.en"), help="Whisper model to use")
     parser.add_argument("--language", default=os.getenv("WHISPER_LANGUAGE", "auto"), help="Audio language")
-    parser.add_argument("--task", default=os.getenv("WHISPER_TASK", "transcribe"), choices=["transcribe", "translate"], help="Task type")
+    parser.add_argument("--task", default=os.getenv("WHISPER_TASK", "transcribe"), choices=TASK_CHOICES, help="Task type")
     parser.add_argument("--formats", default=os.getenv("WHISPER_FORMATS", "srt,txt,json"), help="Output formats (comma-separated)")
     parser.add_argument("--device", default=os.getenv("WHISPER_DEVICE", "auto"), help="Processing device")
     
@@ -1,58 +1,180 @@
-import whisper
+import asyncio
+import contextlib
+import json
+import multiprocessing
 import os
-import torch
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# BF16 math for CPU inference; only pays off on CPUs with native BF16 (AVX-512-BF16, AMX, Arm BF16)
+CPU_BF16 = os.getenv("WHISPER_CPU_BF16", "false").lower() == "true"
+if CPU_BF16:
+    # oneDNN reads these when torch is first imported, so they must be set before importing whisper
+    os.environ.setdefault("DNNL_DEFAULT_FPMATH_MODE", "BF16")
+    os.environ.setdefault("THP_MEM_ALLOC_ENABLE", "1")
+    os.environ.setdefault("LRU_CACHE_CAPACITY", "1024")
+
+# INT8 dynamic quantization of the openai-whisper Linear layers when running on CPU
+CPU_QUANT = os.getenv("WHISPER_CPU_QUANT", "false").lower() == "true"
+
+import numpy as np
+import torch
+import whisper
+
+# PyAV decodes audio in-process; without it whisper spawns the ffmpeg CLI per file
+try:
+    import av
+except ImportError:
+    av = None
+
+# orjson serializes large segment lists several times faster; fall back to json if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Supported output formats
 SUPPORTED_FORMATS = ["srt", "tsv", "txt", "vtt", "json"]
 
+# Supported inference backends
+SUPPORTED_BACKENDS = ["openai", "faster-whisper", "transformers"]
+
+# Defaults for transcribe_audio_core, read once after loading .env
+_DEFAULTS = {
+    "model": os.getenv("WHISPER_MODEL", "small.en"),
+    "language": os.getenv("WHISPER_LANGUAGE"),
+    "task": os.getenv("WHISPER_TASK", "transcribe"),
+    "formats": os.getenv("WHISPER_FORMATS", "txt").split(","),
+    "device": os.getenv("WHISPER_DEVICE", "auto"),
+    "backend": os.getenv("WHISPER_BACKEND", "openai"),
+}
+BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "24"))
+
+# Most recently loaded model, keyed on (backend, model_name, requested device);
+# only one is kept so switching models doesn't accumulate weights in VRAM
+_MODEL_CACHE = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# Split long audio into chunks transcribed in parallel, one worker process per CUDA GPU
+MULTI_GPU = os.getenv("WHISPER_MULTI_GPU", "false").lower() == "true"
+CHUNK_SECONDS = int(os.getenv("WHISPER_CHUNK_SECONDS", "300"))
+
+# Write the output files concurrently; helps on slow disks and network mounts
+CONCURRENT_WRITES = os.getenv("WHISPER_CONCURRENT_WRITES", "false").lower() == "true"
+
+# Multi-GPU worker pool, kept alive between calls and keyed on the model its workers loaded;
+# it shares _MODEL_CACHE_LOCK and is released with the cached model so each GPU holds one copy
+_CHUNK_POOL = {}
+
+# Model loaded by each multi-GPU worker process
+_WORKER_MODEL = None
+
+# Hugging Face checkpoints whose name differs from the openai-whisper model name
+HF_MODEL_ALIASES = {"turbo": "large-v3-turbo"}
+
+def render_text_outputs(segments, formats):
+    """
+    Render the requested text formats (srt, tsv, txt, vtt) in a single pass over the segments.
+    
+    Returns:
+        dict: Maps each requested text format to its file content
+    """
+    srt = [] if "srt" in formats else None
+    tsv = ["start\tend\tspeaker\ttext\n"] if "tsv" in formats else None
+    txt = [] if "txt" in formats else None
+    vtt = ["WEBVTT\n\n"] if "vtt" in formats else None
+    
+    for i, seg in enumerate(segments, 1):
+        text = seg["text"].strip()
+        if srt is not None:
+            srt.append(f"{i}\n{format_timestamp(seg['start'])} --> {format_timestamp(seg['end'])}\n{text}\n\n")
+        if vtt is not None:
+            vtt.append(f"{format_timestamp(seg['start'], vtt=True)} --> {format_timestamp(seg['end'], vtt=True)}\n{text}\n\n")
+        if tsv is not None:
+            tsv.append(f"{seg['start']}\t{seg['end']}\t\t{text}\n")
+        if txt is not None:
+            txt.append(text + "\n")
+    
+    return {fmt: "".join(parts) for fmt, parts in (("srt", srt), ("tsv", tsv), ("txt", txt), ("vtt", vtt)) if parts is not None}
+
+def _open_text(out_path):
+    """Open an output file for writing with a 1 MB buffer and a sequential-access hint."""
+    f = open(out_path, "w", encoding="utf-8", buffering=1 << 20)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f
+
+def write_text(content, out_path):
+    with _open_text(out_path) as f:
+        f.write(content)
+
 def save_srt(segments, out_path):
-    with open(out_path, "w", encoding="utf-8") as f:
-        for i, seg in enumerate(segments, 1):
-            start = format_timestamp(seg["start"])
-            end = format_timestamp(seg["end"])
-            f.write(f"{i}\n{start} --> {end}\n{seg['text'].strip()}\n\n")
+    write_text(render_text_outputs(segments, ["srt"])["srt"], out_path)
 
 def save_tsv(segments, out_path):
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("start\tend\tspeaker\ttext\n")
-        for seg in segments:
-            f.write(f"{seg['start']}\t{seg['end']}\t\t{seg['text'].strip()}\n")
+    write_text(render_text_outputs(segments, ["tsv"])["tsv"], out_path)
 
 def save_txt(segments, out_path):
-    with open(out_path, "w", encoding="utf-8") as f:
-        for seg in segments:
-            f.write(seg['text'].strip() + "\n")
+    write_text(render_text_outputs(segments, ["txt"])["txt"], out_path)
 
 def save_vtt(segments, out_path):
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("WEBVTT\n\n")
-        for seg in segments:
-            start = format_timestamp(seg["start"], vtt=True)
-            end = format_timestamp(seg["end"], vtt=True)
-            f.write(f"{start} --> {end}\n{seg['text'].strip()}\n\n")
+    write_text(render_text_outputs(segments, ["vtt"])["vtt"], out_path)
 
 def save_json(segments, out_path):
-    import json
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(segments, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(out_path, "wb") as f:
+            f.write(orjson.dumps(segments, option=orjson.OPT_INDENT_2))
+    else:
+        with _open_text(out_path) as f:
+            json.dump(segments, f, ensure_ascii=False, indent=2)
 
-def format_timestamp(seconds, vtt=False):
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
-    if vtt:
-        return f"{hours:02}:{minutes:02}:{secs:02}.{millis:03}"
+def save_output(segments, rendered, fmt, out_path):
+    """Save one output format, using the pre-rendered content for text formats."""
+    if fmt == "json":
+        save_json(segments, out_path)
     else:
-        return f"{hours:02}:{minutes:02}:{secs:02},{millis:03}"
+        write_text(rendered[fmt], out_path)
+
+async def save_outputs_concurrently(segments, rendered, outputs):
+    """Save (format, path) outputs in parallel worker threads so their disk writes overlap."""
+    await asyncio.gather(*(
+        asyncio.to_thread(save_output, segments, rendered, fmt, out_path)
+        for fmt, out_path in outputs
+    ))
+
+def save_outputs(segments, formats, outputs):
+    """Render and save all requested (format, path) outputs."""
+    rendered = render_text_outputs(segments, formats)
+    if CONCURRENT_WRITES and len(outputs) > 1:
+        asyncio.run(save_outputs_concurrently(segments, rendered, outputs))
+    else:
+        for fmt, out_path in outputs:
+            save_output(segments, rendered, fmt, out_path)
+    for fmt, out_path in outputs:
+        print(f"Saved {fmt} to {out_path}")
+
+def format_timestamp(seconds, vtt=False):
+    # Work in whole milliseconds, rounded like whisper's own writers
+    millis = round(seconds * 1000)
+    secs, millis = divmod(millis, 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%02d:%02d:%02d%s%03d" % (hours, minutes, secs, "." if vtt else ",", millis)
 
+@lru_cache(maxsize=4)
 def get_device(preferred_device=None):
-    """Detect and return the best available device for inference."""
+    """
+    Detect and return the best available device for inference.
+    
+    Cached per requested device, so the CUDA queries and banner only happen once.
+    """
     if preferred_device and preferred_device.lower() != "auto":
         if preferred_device.lower() == "cuda" and torch.cuda.is_available():
             device = "cuda"
@@ -78,7 +200,257 @@ def get_device(preferred_device=None):
             print(f"💻 Using CPU (no CUDA GPU detected)")
     return device
 
-def transcribe_audio_core(audio_path, model_name=None, language=None, task=None, formats=None, device=None):
+def cpu_inference_context(device, backend):
+    """Return a BF16 autocast context for transformers CPU inference when enabled, else a no-op context."""
+    # openai-whisper's decoder rejects BF16 audio features and its INT8-quantized Linear layers
+    # (WHISPER_CPU_QUANT) only accept FP32 input, so that backend only gets the oneDNN BF16
+    # math mode set above, which keeps its tensors in FP32
+    if device == "cpu" and CPU_BF16 and backend == "transformers":
+        return torch.autocast("cpu", dtype=torch.bfloat16)
+    return contextlib.nullcontext()
+
+def quantize_cpu_model(model):
+    """Dynamically quantize the Linear layers of an openai-whisper CPU model to INT8."""
+    # whisper's Linear subclass only adds a dtype cast, but quantize_dynamic matches exact types
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear):
+            module.__class__ = torch.nn.Linear
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+def load_faster_whisper_model(model_name, device):
+    """Load a CTranslate2 Whisper model with quantized weights (INT8, FP16 activations on CUDA)."""
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        raise ImportError("faster-whisper is not installed. Please run: uv add faster-whisper")
+    compute_type = "int8_float16" if device == "cuda" else "int8"
+    return WhisperModel(model_name, device=device, compute_type=compute_type)
+
+def transcribe_faster_whisper(model, audio_path, language, task):
+    """Transcribe with faster-whisper and return a result shaped like whisper's."""
+    segments_iter, info = model.transcribe(audio_path, language=language, task=task, beam_size=5, vad_filter=True)
+    segments = [
+        {
+            "id": seg.id,
+            "seek": seg.seek,
+            "start": seg.start,
+            "end": seg.end,
+            "text": seg.text,
+            "tokens": seg.tokens,
+            "temperature": seg.temperature,
+            "avg_logprob": seg.avg_logprob,
+            "compression_ratio": seg.compression_ratio,
+            "no_speech_prob": seg.no_speech_prob,
+        }
+        for seg in segments_iter
+    ]
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": info.language
+    }
+
+def load_transformers_pipeline(model_name, device):
+    """Build a batched Hugging Face ASR pipeline (FP16 with Flash Attention 2 on Ampere+ GPUs)."""
+    try:
+        from transformers import pipeline
+    except ImportError:
+        raise ImportError("transformers is not installed. Please run: uv add transformers accelerate")
+    attn_implementation = "sdpa"
+    if device == "cuda":
+        import importlib.util
+        if torch.cuda.get_device_capability()[0] >= 8 and importlib.util.find_spec("flash_attn"):
+            attn_implementation = "flash_attention_2"
+    return pipeline(
+        "automatic-speech-recognition",
+        "openai/whisper-" + HF_MODEL_ALIASES.get(model_name, model_name),
+        torch_dtype=torch.float16 if device == "cuda" else torch.float32,
+        device="cuda:0" if device == "cuda" else "cpu",
+        model_kwargs={"attn_implementation": attn_implementation}
+    )
+
+def transcribe_transformers(pipe, audio_path, language, task, model_name):
+    """Transcribe 30 s chunks in batches and return a result shaped like whisper's."""
+    generate_kwargs = {}
+    # English-only checkpoints reject the task and language options
+    if not model_name.endswith(".en"):
+        generate_kwargs = {"task": task, "language": language}
+    outputs = pipe(
+        audio_path,
+        chunk_length_s=30,
+        batch_size=BATCH_SIZE,
+        return_timestamps=True,
+        generate_kwargs=generate_kwargs
+    )
+    segments = []
+    for i, chunk in enumerate(outputs["chunks"]):
+        start, end = chunk["timestamp"]
+        # The final chunk may have no end timestamp
+        segments.append({"id": i, "start": start, "end": end if end is not None else start, "text": chunk["text"]})
+    return {"text": outputs["text"], "segments": segments, "language": language}
+
+def get_model(model_name, device, backend):
+    """
+    Return a loaded model and the device it ended up on, reusing the cached one when possible.
+    
+    Falls back to CPU if loading on CUDA fails.
+    """
+    key = (backend, model_name, device)
+    with _MODEL_CACHE_LOCK:
+        if key in _MODEL_CACHE:
+            print(f"Reusing loaded model '{model_name}' ({backend})")
+            return _MODEL_CACHE[key]
+        
+        # Release the previous model before loading a new one
+        release_models()
+        load_model = {
+            "faster-whisper": load_faster_whisper_model,
+            "transformers": load_transformers_pipeline
+        }.get(backend, whisper.load_model)
+        print(f"Loading model '{model_name}' on {device} ({backend})...")
+        try:
+            model = load_model(model_name, device=device)
+        except ImportError:
+            raise
+        except Exception as e:
+            if device == "cuda":
+                print(f"⚠️  Failed to load model on CUDA: {str(e)[:100]}...")
+                print(f"🔄 Falling back to CPU...")
+                device = "cpu"
+                model = load_model(model_name, device=device)
+            else:
+                raise e
+        
+        if backend == "openai" and device == "cpu" and CPU_QUANT:
+            print("Quantizing model weights to INT8...")
+            model = quantize_cpu_model(model)
+        
+        _MODEL_CACHE[key] = (model, device)
+        return model, device
+
+def release_models():
+    """Drop the cached model and shut down the multi-GPU worker pool; call with _MODEL_CACHE_LOCK held."""
+    _MODEL_CACHE.clear()
+    for executor in _CHUNK_POOL.values():
+        executor.shutdown()
+    _CHUNK_POOL.clear()
+
+def load_audio(audio_path, sr=whisper.audio.SAMPLE_RATE):
+    """Decode audio to a mono float32 array at sr Hz, in-process with PyAV when available."""
+    if av is None:
+        return whisper.load_audio(audio_path, sr)
+    resampler = av.AudioResampler(format="flt", layout="mono", rate=sr)
+    chunks = []
+    with av.open(audio_path) as container:
+        for frame in container.decode(audio=0):
+            chunks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(frame))
+        # Flush samples still buffered in the resampler
+        chunks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(None))
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+
+def split_audio(audio, chunk_seconds=CHUNK_SECONDS):
+    """
+    Split 16 kHz audio into chunks of about chunk_seconds.
+    
+    Each cut is moved to the quietest 100 ms frame in the 5 s (at most half a chunk)
+    before the boundary so words are not split between chunks.
+    
+    Returns:
+        list: (samples, offset_seconds) tuples
+    """
+    if chunk_seconds <= 0:
+        raise ValueError(f"WHISPER_CHUNK_SECONDS must be positive, got {chunk_seconds}")
+    sr = whisper.audio.SAMPLE_RATE
+    frame = sr // 10
+    lookback = max(frame, min(5 * sr, chunk_seconds * sr // 2) // frame * frame)
+    chunks = []
+    start = 0
+    while len(audio) - start > chunk_seconds * sr:
+        boundary = start + chunk_seconds * sr
+        window = audio[boundary - lookback:boundary].reshape(-1, frame)
+        cut = boundary - lookback + int(np.argmin((window ** 2).mean(axis=1))) * frame
+        chunks.append((audio[start:cut], start / sr))
+        start = cut
+    chunks.append((audio[start:], start / sr))
+    return chunks
+
+def _init_chunk_worker(model_name, device_queue):
+    """Load the model once per worker process on the GPU assigned to it."""
+    global _WORKER_MODEL
+    _WORKER_MODEL = whisper.load_model(model_name, device=device_queue.get())
+
+def _detect_chunk_language(audio):
+    """Detect the spoken language from the first 30 s of a chunk, the way whisper's transcribe does."""
+    if not _WORKER_MODEL.is_multilingual:
+        return "en"
+    mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), _WORKER_MODEL.dims.n_mels, device=_WORKER_MODEL.device)
+    _, probs = _WORKER_MODEL.detect_language(mel)
+    return max(probs, key=probs.get)
+
+def _transcribe_chunk(audio, offset, language, task):
+    """Transcribe one chunk in a worker and shift its timestamps by the chunk offset."""
+    result = _WORKER_MODEL.transcribe(audio, language=language, task=task)
+    for seg in result["segments"]:
+        seg["start"] += offset
+        seg["end"] += offset
+    return result
+
+def get_chunk_pool(model_name):
+    """Return the multi-GPU worker pool for model_name, starting one worker per GPU on first use."""
+    with _MODEL_CACHE_LOCK:
+        if model_name in _CHUNK_POOL:
+            return _CHUNK_POOL[model_name]
+        
+        # Release the previous pool and any single-device model before loading on every GPU
+        release_models()
+        gpu_count = torch.cuda.device_count()
+        # CUDA can't be used in forked children
+        ctx = multiprocessing.get_context("spawn")
+        device_queue = ctx.Queue()
+        for i in range(gpu_count):
+            device_queue.put(f"cuda:{i}")
+        print(f"Loading model '{model_name}' on {gpu_count} GPUs...")
+        _CHUNK_POOL[model_name] = ProcessPoolExecutor(max_workers=gpu_count, mp_context=ctx,
+                                                      initializer=_init_chunk_worker,
+                                                      initargs=(model_name, device_queue))
+        return _CHUNK_POOL[model_name]
+
+def transcribe_multi_gpu(chunks, model_name, language, task):
+    """
+    Transcribe audio chunks across all CUDA GPUs and stitch the results in order.
+    
+    Returns None if a worker failed (e.g. out of memory loading the model), after
+    dropping the broken pool so the caller can fall back to a single device.
+    """
+    executor = get_chunk_pool(model_name)
+    try:
+        if language is None and len(chunks) > 1:
+            # Detect once from the start of the audio so every chunk is decoded in the same language
+            language = executor.submit(_detect_chunk_language, chunks[0][0]).result()
+            print(f"Detected language: {language}")
+        
+        print(f"🚀 Transcribing {len(chunks)} chunks on {torch.cuda.device_count()} GPUs...")
+        futures = [executor.submit(_transcribe_chunk, audio, offset, language, task) for audio, offset in chunks]
+        results = [future.result() for future in futures]
+    except BrokenProcessPool as e:
+        with _MODEL_CACHE_LOCK:
+            if _CHUNK_POOL.get(model_name) is executor:
+                del _CHUNK_POOL[model_name]
+        executor.shutdown(wait=False, cancel_futures=True)
+        print(f"⚠️  Multi-GPU workers failed: {str(e)[:100]}...")
+        print(f"🔄 Falling back to a single device...")
+        return None
+    
+    segments = [seg for result in results for seg in result["segments"]]
+    for i, seg in enumerate(segments):
+        seg["id"] = i
+    return {
+        "text": "".join(result["text"] for result in results),
+        "segments": segments,
+        "language": language or results[0]["language"]
+    }
+
+def transcribe_audio_core(audio_path, model_name=None, language=None, task=None, formats=None, device=None, backend=None):
     """
     Core transcription function that can be used by both CLI and Gradio.
     
@@ -89,16 +461,18 @@ def transcribe_audio_core(audio_path, model_name=None, language=None, task=None,
         task: 'transcribe' or 'translate'
         formats: List of output formats
         device: 'auto', 'cuda', or 'cpu'
+        backend: 'openai', 'faster-whisper', or 'transformers'
     
     Returns:
         dict: Contains output_dir, files, and metadata
     """
     # Use defaults from environment if not specified
-    model_name = model_name or os.getenv("WHISPER_MODEL", "small.en")
-    language = language or os.getenv("WHISPER_LANGUAGE")
-    task = task or os.getenv("WHISPER_TASK", "transcribe")
-    formats = formats or os.getenv("WHISPER_FORMATS", "txt").split(",")
-    device = device or os.getenv("WHISPER_DEVICE", "auto")
+    model_name = model_name or _DEFAULTS["model"]
+    language = language or _DEFAULTS["language"]
+    task = task or _DEFAULTS["task"]
+    formats = formats or _DEFAULTS["formats"]
+    device = device or _DEFAULTS["device"]
+    backend = backend or _DEFAULTS["backend"]
     
     # Handle language auto-detection
     if language in [None, "", "auto", "Auto Detect"]:
@@ -112,29 +486,41 @@ def transcribe_audio_core(audio_path, model_name=None, language=None, task=None,
     if not formats:
         raise ValueError("No valid formats selected. Supported: " + ", ".join(SUPPORTED_FORMATS))
     
+    if backend not in SUPPORTED_BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Supported: " + ", ".join(SUPPORTED_BACKENDS))
+    
     # Check if the audio file exists
-    if not os.path.exists(audio_path):
-        raise FileNotFoundError(f"Audio file '{audio_path}' not found.")
+    try:
+        os.stat(audio_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Audio file '{audio_path}' not found.") from None
 
     # Detect best available device
     device = get_device(device)
     
-    # Load model with fallback
-    print(f"Loading model '{model_name}' on {device}...")
-    try:
-        model = whisper.load_model(model_name, device=device)
-    except Exception as e:
-        if device == "cuda":
-            print(f"⚠️  Failed to load model on CUDA: {str(e)[:100]}...")
-            print(f"🔄 Falling back to CPU...")
-            device = "cpu"
-            model = whisper.load_model(model_name, device=device)
-        else:
-            raise e
+    # openai-whisper takes a decoded array; decoding it here avoids an ffmpeg subprocess when PyAV is installed
+    audio = load_audio(audio_path) if backend == "openai" else audio_path
+    
+    # On multiple GPUs the worker pool handles all audio, splitting long files into chunks
+    # transcribed in parallel; short files still use it so GPU 0 never holds a second model copy.
+    # If the pool fails, result stays None and the single-device path below takes over
+    result = None
+    if MULTI_GPU and backend == "openai" and device == "cuda" and torch.cuda.device_count() > 1:
+        result = transcribe_multi_gpu(split_audio(audio), model_name, language, task)
     
-    # Transcribe audio
-    print(f"Starting transcription...")
-    result = model.transcribe(audio_path, language=language, task=task)
+    if result is None:
+        # Load model (reused across calls) with fallback
+        model, device = get_model(model_name, device, backend)
+        
+        # Transcribe audio
+        print(f"Starting transcription...")
+        with cpu_inference_context(device, backend):
+            if backend == "faster-whisper":
+                result = transcribe_faster_whisper(model, audio_path, language, task)
+            elif backend == "transformers":
+                result = transcribe_transformers(model, audio_path, language, task, model_name)
+            else:
+                result = model.transcribe(audio, language=language, task=task)
     segments = result["segments"]
     
     # Create outputs directory with date and time
@@ -145,30 +531,19 @@ def transcribe_audio_core(audio_path, model_name=None, language=None, task=None,
     # Get the base filename (without extension) from the audio file
     audio_filename = os.path.basename(audio_path)
     base = os.path.splitext(audio_filename)[0]
+    # Every output shares this path prefix; only the extension differs
+    out_prefix = os.path.join(output_dir, base) + "."
     
-    # Save files in requested formats
-    output_files = []
-    for fmt in formats:
-        out_path = os.path.join(output_dir, f"{base}.{fmt}")
-        if fmt == "srt":
-            save_srt(segments, out_path)
-        elif fmt == "tsv":
-            save_tsv(segments, out_path)
-        elif fmt == "txt":
-            save_txt(segments, out_path)
-        elif fmt == "vtt":
-            save_vtt(segments, out_path)
-        elif fmt == "json":
-            save_json(segments, out_path)
-        
-        output_files.append(out_path)
-        print(f"Saved {fmt} to {out_path}")
+    # Save files in requested formats, rendering all text formats in one pass
+    outputs = [(fmt, out_prefix + fmt) for fmt in formats]
+    save_outputs(segments, formats, outputs)
     
     return {
         "output_dir": output_dir,
-        "files": output_files,
+        "files": [out_path for _, out_path in outputs],
         "segments": segments,
         "language": result.get("language"),
         "model": model_name,
-        "device": device
+        "device": device,
+        "backend": backend
     }